@@ -40,6 +40,8 @@ import bpy
 from . import constants
 from .core import properties
 from .core import rig_builder
+from .core import scene_cache
+from .operators import draw_part
 
 # Import classes for registration
 from .operators.create_puppet import PUPPET_OT_create_puppet
@@ -51,6 +53,7 @@ from .operators.draw_part import (
 )
 from .panels.main_panel import (
     PUPPET_PT_main_panel,
+    PUPPET_PT_outliner_panel,
     PUPPET_OT_select_puppet,
     PUPPET_OT_set_view,
     PUPPET_OT_set_hand_pose,
@@ -78,17 +81,21 @@ classes = [
     PUPPET_OT_quick_select_part,
     # Panels
     PUPPET_PT_main_panel,
+    PUPPET_PT_outliner_panel,
 ]
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
     """Register all add-on classes with Blender."""
     # Register properties first (they're needed by panels)
     properties.register()
+    rig_builder.register()
+    scene_cache.register()
 
     # Register all classes
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
 
     print(f"Puppet Mode v{'.'.join(map(str, bl_info['version']))} registered")
 
@@ -96,10 +103,12 @@ def register():
 def unregister():
     """Unregister all add-on classes from Blender."""
     # Unregister classes
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    draw_part.cancel_view_visibility()
+    _unregister_classes()
 
     # Unregister properties last
+    scene_cache.unregister()
+    rig_builder.unregister()
     properties.unregister()
 
     print("Puppet Mode unregistered")
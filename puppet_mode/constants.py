@@ -28,6 +28,9 @@ FULL_VIEWS = ["Front", "Quarter_L", "Quarter_R", "Profile_L", "Profile_R", "Back
 # Hand poses (optional, for expressive hands)
 HAND_POSES = ["Open", "Fist", "Point"]
 
+# Grease Pencil object types: GP v3 (Blender 4.3+) and legacy GP
+GP_OBJECT_TYPES = ('GREASEPENCIL', 'GPENCIL')
+
 # Legacy compatibility - keep these for existing code
 ROTATION_VIEWS_FULL = CHARACTER_VIEWS + ["Back"]
 ROTATION_VIEWS_SIMPLE = ["Front", "Side"]
@@ -575,6 +578,13 @@ UI_BODY_REGIONS = {
     "Hands": ["Hand_L", "Hand_R"],
 }
 
+# Part -> region enum id (FACE/BODY/HANDS) for the part selector
+PART_TO_REGION = {
+    part: region.upper()
+    for region, parts in UI_BODY_REGIONS.items()
+    for part in parts
+}
+
 # Parts that should be in the mini-outliner
 OUTLINER_PARTS = [
     ("Face_Features", "Face"),
@@ -604,9 +614,13 @@ def get_all_layer_names():
     return layers
 
 
+# Total drawable layers; fixed at import, so callers needn't recount
+TOTAL_DRAWABLE_PARTS = len(get_all_layer_names())
+
+
 def get_total_drawable_parts():
     """Return the total count of drawable parts."""
-    return len(get_all_layer_names())
+    return TOTAL_DRAWABLE_PARTS
 
 
 def get_layers_for_part(part_name, view=None):
@@ -677,15 +691,34 @@ def get_active_layers_for_view(view, hand_pose="Open"):
       Face_Features, Mouth, Hand_L_Open, Hand_R_Open,
       Leg_L_Front, Leg_R_Front, Foot_L, Foot_R
     """
-    layers = []
-    for part in DRAWABLE_PARTS:
-        if part in VIEW_DEPENDENT_PARTS:
-            layers.append(f"{part}_{view}")
-        elif part.startswith("Hand_"):
-            layers.append(f"{part}_{hand_pose}")
-        else:
-            layers.append(part)
-    return layers
+    return [_layer_name(part, view, hand_pose) for part in DRAWABLE_PARTS]
+
+
+def _layer_name(part, view, hand_pose):
+    """Resolve part + view + hand pose to its layer name."""
+    if part in VIEW_DEPENDENT_PARTS:
+        return f"{part}_{view}"
+    if part.startswith("Hand_"):
+        return f"{part}_{hand_pose}"
+    return part
+
+
+# (part, view, hand_pose) -> layer name for every selectable combination.
+# The enum space is small, so UI code can look names up instead of
+# formatting them on each redraw.
+LAYER_NAME = {
+    (part, view, pose): _layer_name(part, view, pose)
+    for part in DRAWABLE_PARTS
+    for view in CHARACTER_VIEWS
+    for pose in HAND_POSES
+}
+
+# (view, hand_pose) -> frozenset of the layers shown for that combination
+ACTIVE_LAYERS = {
+    (view, pose): frozenset(LAYER_NAME[(part, view, pose)] for part in DRAWABLE_PARTS)
+    for view in CHARACTER_VIEWS
+    for pose in HAND_POSES
+}
 
 
 # ----------------------------------------------------------------------------
@@ -717,9 +750,9 @@ def _get_base_part_from_layer(layer_name):
     return layer_name
 
 
-def get_y_offset_for_layer(layer_name):
+def _compute_y_offset(layer_name):
     """
-    Get Y-axis offset for z-ordering in front orthographic view.
+    Compute Y-axis offset for z-ordering in front orthographic view.
     More negative Y = closer to camera = rendered in front.
     Uses LAYER_ORDER to determine stacking order.
     """
@@ -730,3 +763,18 @@ def get_y_offset_for_layer(layer_name):
         index = len(LAYER_ORDER)
     # Frontmost (index 0) gets most negative Y
     return -(len(LAYER_ORDER) - index) * 0.001
+
+
+# Layer names are a fixed set, so offsets are computed once at import
+_Y_OFFSET_CACHE = {name: _compute_y_offset(name) for name in get_all_layer_names()}
+
+
+def get_y_offset_for_layer(layer_name):
+    """
+    Get Y-axis offset for z-ordering in front orthographic view.
+    Known layers come from a precomputed table; others are computed.
+    """
+    offset = _Y_OFFSET_CACHE.get(layer_name)
+    if offset is None:
+        offset = _compute_y_offset(layer_name)
+    return offset
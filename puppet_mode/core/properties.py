@@ -29,6 +29,8 @@ from ..constants import (
     VIEW_INDEPENDENT_PARTS,
     get_gp_object_name,
     get_all_layer_names,
+    LAYER_NAME,
+    ACTIVE_LAYERS,
     # Legacy compatibility
     ROTATION_VIEWS_FULL,
     ROTATION_VIEWS_SIMPLE,
@@ -61,80 +63,80 @@ def get_region_items(self, context):
     ]
 
 
+# Readable labels where the default (underscores -> spaces) isn't enough
+_PART_LABEL_OVERRIDES = {
+    "Face_Features": "Face (Eyes, Brows)",
+    "Arm_L": "Left Arm",
+    "Arm_R": "Right Arm",
+    "Leg_L": "Left Leg",
+    "Leg_R": "Right Leg",
+    "Hand_L": "Left Hand",
+    "Hand_R": "Right Hand",
+    "Foot_L": "Left Foot",
+    "Foot_R": "Right Foot",
+}
+
+_NO_PART_ITEMS = [('NONE', 'None', 'No parts available')]
+
+
+def _build_part_items():
+    """
+    Build the part enum items for each region enum id (FACE/BODY/HANDS).
+    Computed once at import; the region -> parts mapping never changes.
+    """
+    table = {}
+    for region, parts in UI_BODY_REGIONS.items():
+        items = []
+        for part in parts:
+            label = _PART_LABEL_OVERRIDES.get(part) or part.replace('_', ' ')
+            items.append((part, label, f'Draw {label}'))
+        table[region.upper()] = items or _NO_PART_ITEMS
+    return table
+
+
+_PART_ITEMS = _build_part_items()
+
+
 def get_part_items(self, context):
     """
     Return the body part options based on selected region.
     SIMPLIFIED: Uses new DRAWABLE_PARTS structure.
     """
-    items = []
-    region = self.region
-
-    if region == 'FACE':
-        parts = UI_BODY_REGIONS.get('Face', [])
-    elif region == 'BODY':
-        parts = UI_BODY_REGIONS.get('Body', [])
-    elif region == 'HANDS':
-        parts = UI_BODY_REGIONS.get('Hands', [])
-    else:
-        parts = []
-
-    for part in parts:
-        # Create a readable label
-        label = part.replace('_', ' ').replace('L', 'Left').replace('R', 'Right')
-        # Better labels
-        if part == "Face_Features":
-            label = "Face (Eyes, Brows)"
-        elif part == "Arm_L":
-            label = "Left Arm"
-        elif part == "Arm_R":
-            label = "Right Arm"
-        elif part == "Leg_L":
-            label = "Left Leg"
-        elif part == "Leg_R":
-            label = "Right Leg"
-        elif part == "Hand_L":
-            label = "Left Hand"
-        elif part == "Hand_R":
-            label = "Right Hand"
-        elif part == "Foot_L":
-            label = "Left Foot"
-        elif part == "Foot_R":
-            label = "Right Foot"
-
-        items.append((part, label, f'Draw {label}'))
-
-    if not items:
-        items.append(('NONE', 'None', 'No parts available'))
-
-    return items
+    return _PART_ITEMS.get(self.region, _NO_PART_ITEMS)
 
 
-def get_rotation_items(self, context):
+def _build_rotation_items():
     """
-    Return rotation view options based on selected part.
-    SIMPLIFIED: Most parts now use character_view instead.
+    Build the rotation/variant enum items for every drawable part.
+    Computed once at import; the part -> items mapping never changes.
     """
-    items = []
-    part = self.part
-
-    # View-dependent parts don't need rotation selector
-    # (they use character_view instead)
-    if part in VIEW_DEPENDENT_PARTS:
-        items.append(('USE_VIEW', '(Uses Character View)', 'This part uses the character view setting'))
-    elif part in VIEW_INDEPENDENT_PARTS:
-        if part.startswith('Hand_'):
+    table = {}
+    for part in DRAWABLE_PARTS:
+        # View-dependent parts don't need rotation selector
+        # (they use character_view instead)
+        if part in VIEW_DEPENDENT_PARTS:
+            items = [('USE_VIEW', '(Uses Character View)', 'This part uses the character view setting')]
+        elif part in VIEW_INDEPENDENT_PARTS and part.startswith('Hand_'):
             # Hands have pose variants
-            for pose in HAND_POSES:
-                items.append((pose, pose, f'{pose} hand pose'))
+            items = [(pose, pose, f'{pose} hand pose') for pose in HAND_POSES]
+        elif part in VIEW_INDEPENDENT_PARTS:
+            items = [('Default', 'Default', 'Single view')]
         else:
-            items.append(('Default', 'Default', 'Single view'))
-    else:
-        items.append(('Default', 'Default', 'Default view'))
+            items = [('Default', 'Default', 'Default view')]
+        table[part] = items
+    return table
 
-    if not items:
-        items.append(('NONE', 'None', 'No options'))
 
-    return items
+_PART_ROTATION_ITEMS = _build_rotation_items()
+_DEFAULT_ROTATION_ITEMS = [('Default', 'Default', 'Default view')]
+
+
+def get_rotation_items(self, context):
+    """
+    Return rotation view options based on selected part.
+    SIMPLIFIED: Most parts now use character_view instead.
+    """
+    return _PART_ROTATION_ITEMS.get(self.part, _DEFAULT_ROTATION_ITEMS)
 
 
 def get_hand_pose_items(self, context):
@@ -149,6 +151,14 @@ def get_hand_pose_items(self, context):
 # PROPERTY GROUP
 # ----------------------------------------------------------------------------
 
+def _on_character_view_changed(self, context):
+    """Show the parts for the newly selected view (debounced)."""
+    # Imported here: the operators module depends on this one
+    from ..operators.draw_part import schedule_view_visibility
+
+    schedule_view_visibility()
+
+
 class PUPPET_PG_selector(PropertyGroup):
     """
     Property group storing the current body part selection state.
@@ -163,6 +173,7 @@ class PUPPET_PG_selector(PropertyGroup):
         description="Which angle of the character to draw",
         items=get_character_view_items,
         default=0,
+        update=_on_character_view_changed,
     )
 
     # Body region filter (Face/Body/Hands)
@@ -194,6 +205,14 @@ class PUPPET_PG_selector(PropertyGroup):
         default=0,
     )
 
+    # Last resolved puppet armature (avoids scanning all objects on poll)
+    active_puppet_name: StringProperty(
+        name="Active Puppet",
+        description="Name of the last puppet armature operated on",
+        default="",
+        options={'HIDDEN'},
+    )
+
     # Reference opacity while drawing
     reference_opacity: FloatProperty(
         name="Reference Opacity",
@@ -237,76 +256,69 @@ def get_current_layer_name(context):
     - Hand_L + Open pose -> "Hand_L_Open"
     """
     props = context.scene.puppet_selector
-    part = props.part
-    view = props.character_view
-
-    # View-independent parts
-    if part in ['Face_Features', 'Mouth']:
-        return part
-
-    if part in ['Foot_L', 'Foot_R']:
-        return part
-
-    # Hand parts use pose instead of view
-    if part.startswith('Hand_'):
-        pose = props.hand_pose
-        return f"{part}_{pose}"
-
-    # View-dependent parts: combine part + view
-    if part in VIEW_DEPENDENT_PARTS:
-        return f"{part}_{view}"
-
-    # Fallback
-    return part
+    key = (props.part, props.character_view, props.hand_pose)
+    try:
+        return LAYER_NAME[key]
+    except KeyError:
+        # Placeholder part (e.g. 'NONE') or an unknown enum value
+        return props.part
 
 
 def get_view_layer_names(context):
     """
     Get layer names relevant to the current view + hand pose.
-    Returns a set of layer names that should be visible for the current view.
+    Returns a frozenset of layer names that should be visible for the
+    current view, precomputed per view + pose in constants.ACTIVE_LAYERS.
     """
-    from ..constants import get_active_layers_for_view
     props = context.scene.puppet_selector
-    return set(get_active_layers_for_view(props.character_view, props.hand_pose))
+    key = (props.character_view, props.hand_pose)
+    try:
+        return ACTIVE_LAYERS[key]
+    except KeyError:
+        from ..constants import get_active_layers_for_view
+        return frozenset(get_active_layers_for_view(*key))
 
 
-def is_layer_drawn(armature_obj, layer_name):
-    """
-    Check if a body part has been drawn.
-    In the per-object architecture, a part is drawn if its GP object exists.
-    """
-    if not armature_obj:
-        return False
-    puppet_name = armature_obj.get("puppet_name", "")
-    if not puppet_name:
-        return False
-    gp_name = get_gp_object_name(puppet_name, layer_name)
-    return gp_name in bpy.data.objects
+# Every possible layer name, for filtering object-name scans
+_ALL_LAYER_NAMES = frozenset(get_all_layer_names())
 
 
-def count_drawn_parts(armature_obj):
+def get_drawn_layer_names(armature_obj):
     """
-    Count how many parts have been drawn (have GP objects).
-    Returns (drawn_count, total_count).
+    Return the set of layer names that have been drawn for a puppet.
+    Scans object names once (prefix match on the puppet name) instead of
+    probing bpy.data.objects per layer.
     """
     if not armature_obj:
-        return 0, 0
+        return frozenset()
+    puppet_name = armature_obj.get("puppet_name", "")
+    if not puppet_name:
+        return frozenset()
 
-    all_layers = get_all_layer_names()
-    total = len(all_layers)
-    drawn = sum(1 for ln in all_layers if is_layer_drawn(armature_obj, ln))
-    return drawn, total
+    prefix = get_gp_object_name(puppet_name, "")
+    prefix_len = len(prefix)
+    found = {
+        name[prefix_len:]
+        for name in bpy.data.objects.keys()
+        if name.startswith(prefix)
+    }
+    return frozenset(found & _ALL_LAYER_NAMES)
 
 
 # ----------------------------------------------------------------------------
 # REGISTRATION
 # ----------------------------------------------------------------------------
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(
+    (PUPPET_PG_selector,)
+)
+
+
 def register():
-    bpy.utils.register_class(PUPPET_PG_selector)
+    _register_classes()
     bpy.types.Scene.puppet_selector = PointerProperty(type=PUPPET_PG_selector)
 
 
 def unregister():
     del bpy.types.Scene.puppet_selector
-    bpy.utils.unregister_class(PUPPET_PG_selector)
+    _unregister_classes()
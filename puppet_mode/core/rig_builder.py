@@ -5,7 +5,10 @@
 # Optimized for Blender's 2D Animation workflow.
 # ============================================================================
 
+import json
+
 import bpy
+from bpy.app.handlers import persistent
 from mathutils import Vector
 
 from ..constants import (
@@ -19,42 +22,64 @@ from ..constants import (
 # 2D ANIMATION MODE SETUP
 # ----------------------------------------------------------------------------
 
-def deselect_all_objects():
+def deselect_all_objects(context):
     """
     Deselect all objects without using operators (context-safe).
+    Only the currently selected objects are touched, not every object
+    in the file.
     """
-    for obj in bpy.data.objects:
+    for obj in list(context.selected_objects):
         obj.select_set(False)
 
 
-def setup_2d_view(context):
+def _first_view3d_space(context):
+    """
+    Return the region_3d of the first 3D viewport on the current screen.
+    Returns None if the screen has no 3D viewport.
+    """
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            for space in area.spaces:
+                if space.type == 'VIEW_3D':
+                    return space.region_3d
+    return None
+
+
+def setup_2d_view(context, region_3d=None):
     """
     Configure the 3D viewport for 2D animation work.
     - Sets view to Front Orthographic
+
+    Pass region_3d to reuse an already-resolved viewport.
     """
     from mathutils import Quaternion
     import math
 
-    # Get the 3D viewport area and configure it
-    for area in context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for space in area.spaces:
-                if space.type == 'VIEW_3D':
-                    # Set to Front Orthographic view
-                    space.region_3d.view_perspective = 'ORTHO'
-                    # Front view quaternion (90 degrees around X axis)
-                    space.region_3d.view_rotation = Quaternion(
-                        (math.cos(math.pi/4), math.sin(math.pi/4), 0, 0)
-                    )
-                    break
-            break
+    if region_3d is None:
+        region_3d = _first_view3d_space(context)
+    if region_3d is None:
+        return
+
+    # Set to Front Orthographic view
+    region_3d.view_perspective = 'ORTHO'
+    # Front view quaternion (90 degrees around X axis)
+    region_3d.view_rotation = Quaternion(
+        (math.cos(math.pi/4), math.sin(math.pi/4), 0, 0)
+    )
 
 
-def frame_puppet_in_view(context, armature_obj):
+def frame_puppet_in_view(context, armature_obj, region_3d=None):
     """
     Frame the view to show the full puppet.
     Uses direct view manipulation to avoid context issues.
+
+    Pass region_3d to reuse an already-resolved viewport.
     """
+    if region_3d is None:
+        region_3d = _first_view3d_space(context)
+    if region_3d is None:
+        return
+
     # Calculate bounding box of armature to frame it
     # Get the armature's bounding box center and size
     bbox_center = armature_obj.location
@@ -62,20 +87,13 @@ def frame_puppet_in_view(context, armature_obj):
     # Estimate view distance based on armature size (puppet is ~2 units tall)
     view_distance = 3.0
 
-    # Set view location and distance in all 3D viewports
-    for area in context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for space in area.spaces:
-                if space.type == 'VIEW_3D':
-                    # Set the view to look at the puppet center
-                    space.region_3d.view_location = (
-                        bbox_center.x,
-                        bbox_center.y,
-                        bbox_center.z + 1.0  # Center on middle of puppet (it's ~2 units tall)
-                    )
-                    space.region_3d.view_distance = view_distance
-                    break
-            break
+    # Set the view to look at the puppet center
+    region_3d.view_location = (
+        bbox_center.x,
+        bbox_center.y,
+        bbox_center.z + 1.0  # Center on middle of puppet (it's ~2 units tall)
+    )
+    region_3d.view_distance = view_distance
 
 
 # ----------------------------------------------------------------------------
@@ -86,14 +104,24 @@ def get_unique_name(base_name, existing_names):
     """
     Generate a unique name by appending a number suffix.
     E.g., "Puppet" -> "Puppet_001", "Puppet_002", etc.
+
+    Scans existing_names once for the highest numeric suffix and
+    returns the next one after it.
     """
-    # Check if base name already has a numeric suffix
-    if base_name in existing_names:
-        counter = 1
-        while f"{base_name}_{counter:03d}" in existing_names:
-            counter += 1
-        return f"{base_name}_{counter:03d}"
-    return base_name
+    if base_name not in existing_names:
+        return base_name
+
+    prefix = base_name + "_"
+    prefix_len = len(prefix)
+    max_suffix = 0
+    for name in existing_names:
+        if name.startswith(prefix):
+            suffix = name[prefix_len:]
+            if suffix.isdecimal():
+                value = int(suffix)
+                if value > max_suffix:
+                    max_suffix = value
+    return f"{base_name}_{max_suffix + 1:03d}"
 
 
 def get_blender_version():
@@ -101,13 +129,16 @@ def get_blender_version():
     return bpy.app.version
 
 
+# bpy.app.version is fixed for the session, so resolve this once
+_IS_GP_V3 = get_blender_version() >= (4, 3, 0)
+
+
 def is_gp_v3():
     """
     Check if we're using Grease Pencil v3 (Blender 4.3+).
     GP v3 has a different API structure.
     """
-    version = get_blender_version()
-    return version >= (4, 3, 0)
+    return _IS_GP_V3
 
 
 # ----------------------------------------------------------------------------
@@ -137,8 +168,8 @@ def create_armature(name, context):
     armature_obj.select_set(True)
     bpy.ops.object.mode_set(mode='EDIT')
 
-    # Build bones recursively from hierarchy
-    _build_bones_recursive(armature_data, BONE_HIERARCHY, parent_bone=None)
+    # Build bones from hierarchy
+    _build_bones(armature_data, BONE_HIERARCHY)
 
     # Return to object mode
     bpy.ops.object.mode_set(mode='OBJECT')
@@ -149,22 +180,35 @@ def create_armature(name, context):
     return armature_obj
 
 
-def _build_bones_recursive(armature_data, hierarchy, parent_bone):
+def _build_bones(armature_data, hierarchy):
     """
-    Recursively create bones from the hierarchy dictionary.
+    Create bones from the hierarchy dictionary.
+    Walks the tree with an explicit stack (depth-first, same order as
+    the dictionary) instead of recursing per level.
 
     Args:
         armature_data: The armature data block
         hierarchy: Dictionary of bone definitions
-        parent_bone: Parent edit bone (or None for root)
     """
-    for bone_name, bone_data in hierarchy.items():
+    # Bind hot lookups once for the loop
+    new_bone = armature_data.edit_bones.new
+    V = Vector
+
+    # Stack of (bone_name, bone_data, parent_edit_bone); reversed so
+    # popping yields bones in dictionary order
+    stack = [(name, data, None) for name, data in reversed(hierarchy.items())]
+    push = stack.append
+    pop = stack.pop
+
+    while stack:
+        bone_name, bone_data, parent_bone = pop()
+
         # Create the bone
-        bone = armature_data.edit_bones.new(bone_name)
+        bone = new_bone(bone_name)
 
         # Set head and tail positions
-        bone.head = Vector(bone_data["head"])
-        bone.tail = Vector(bone_data["tail"])
+        bone.head = V(bone_data["head"])
+        bone.tail = V(bone_data["tail"])
 
         # Set parent if provided
         if parent_bone is not None:
@@ -173,9 +217,15 @@ def _build_bones_recursive(armature_data, hierarchy, parent_bone):
             if parent_bone.tail == bone.head:
                 bone.use_connect = True
 
-        # Recursively create children
-        if bone_data.get("children"):
-            _build_bones_recursive(armature_data, bone_data["children"], bone)
+        # Queue children
+        children = bone_data.get("children")
+        if children:
+            for child_name, child_data in reversed(children.items()):
+                push((child_name, child_data, bone))
+
+
+# Subtle guide color for the armature (light blue, 50% alpha)
+_DISPLAY_COLOR = (0.2, 0.6, 1.0, 0.5)
 
 
 def _configure_armature_display(armature_obj):
@@ -185,21 +235,31 @@ def _configure_armature_display(armature_obj):
     - In Front enabled so bones show through GP strokes
     - Semi-transparent appearance
     - Custom colors for easy identification
+
+    Armature data is written first, then the object, so each ID is
+    tagged for update in one run. Values that already match are skipped
+    to avoid needless update tags.
     """
     armature = armature_obj.data
 
-    # Display settings optimized for 2D drawing guide
-    armature.display_type = 'WIRE'  # Wire is cleaner for 2D tracing
-    armature_obj.show_in_front = True  # Always visible as drawing guide
-
-    # Make armature semi-transparent so it doesn't obscure drawing
-    armature_obj.show_wire = True
-
+    # --- Armature data ---
+    # Wire is cleaner for 2D tracing
+    if armature.display_type != 'WIRE':
+        armature.display_type = 'WIRE'
     # Enable bone colors (available in Blender 4.0+)
-    armature.show_bone_colors = True
+    if not armature.show_bone_colors:
+        armature.show_bone_colors = True
 
-    # Set a subtle color for the armature (light blue guide color)
-    armature_obj.color = (0.2, 0.6, 1.0, 0.5)  # Light blue, 50% alpha
+    # --- Armature object ---
+    # Always visible as drawing guide
+    if not armature_obj.show_in_front:
+        armature_obj.show_in_front = True
+    # Make armature semi-transparent so it doesn't obscure drawing
+    if not armature_obj.show_wire:
+        armature_obj.show_wire = True
+    # Color is stored as float32, so compare with a tolerance
+    if any(abs(a - b) > 1e-6 for a, b in zip(armature_obj.color, _DISPLAY_COLOR)):
+        armature_obj.color = _DISPLAY_COLOR
 
 
 # ----------------------------------------------------------------------------
@@ -224,16 +284,96 @@ def create_puppet_collection(puppet_name, context):
 # disappear when switching active layers within a single GP object.
 # ----------------------------------------------------------------------------
 
+# GP API capability flags for this Blender build.
+# Probed once on first GP object creation instead of hasattr() per call.
+_GP_CAPS = {}
+
+
+def _get_gp_caps(gp_data=None, layer=None):
+    """
+    Return the memoized GP capability flags, probing any that are missing.
+    Data-level flags need gp_data, layer-level flags need a layer.
+    """
+    if 'has_gp_v3_data' not in _GP_CAPS:
+        _GP_CAPS['has_gp_v3_data'] = hasattr(bpy.data, 'grease_pencils_v3')
+
+    if gp_data is not None and 'has_layers_new' not in _GP_CAPS:
+        _GP_CAPS['has_layers_new'] = hasattr(gp_data.layers, 'new')
+        _GP_CAPS['has_autolock'] = hasattr(gp_data, 'use_autolock_layers')
+
+    if layer is not None and 'has_hide' not in _GP_CAPS:
+        _GP_CAPS['has_hide'] = hasattr(layer, 'hide')
+        _GP_CAPS['has_opacity'] = hasattr(layer, 'opacity')
+        # Legacy GP needs an initial frame
+        _GP_CAPS['needs_initial_frame'] = not is_gp_v3() and hasattr(layer, 'frames')
+
+    return _GP_CAPS
+
+
+def _new_gp_data(gp_name):
+    """
+    Create a GP data block in whichever collection this build supports.
+    The first call resolves grease_pencils_v3 vs grease_pencils and
+    memoizes the choice, so later calls dispatch directly.
+    """
+    data_attr = _GP_CAPS.get('gp_data_attr')
+    if data_attr is not None:
+        return getattr(bpy.data, data_attr).new(gp_name)
+
+    if is_gp_v3() and _get_gp_caps()['has_gp_v3_data']:
+        try:
+            gp_data = bpy.data.grease_pencils_v3.new(gp_name)
+            _GP_CAPS['gp_data_attr'] = 'grease_pencils_v3'
+            return gp_data
+        except Exception:
+            pass
+
+    _GP_CAPS['gp_data_attr'] = 'grease_pencils'
+    return bpy.data.grease_pencils.new(gp_name)
+
+
+def _new_gp_layer(gp_data, layer_name):
+    """
+    Create a GP layer, passing the name positionally or by keyword.
+    The first call detects which signature layers.new() accepts and
+    memoizes it, so the TypeError fallback runs at most once.
+    """
+    use_kwarg = _GP_CAPS.get('layers_new_kwarg')
+    if use_kwarg is None:
+        try:
+            layer = gp_data.layers.new(name=layer_name)
+        except TypeError:
+            _GP_CAPS['layers_new_kwarg'] = False
+            return gp_data.layers.new(layer_name)
+        _GP_CAPS['layers_new_kwarg'] = True
+        return layer
+
+    if use_kwarg:
+        return gp_data.layers.new(name=layer_name)
+    return gp_data.layers.new(layer_name)
+
+
+# Shared stroke material names by puppet name (cleared on file load).
+# Names, not Material objects, so an undo step can't leave freed data here.
+_MAT_CACHE = {}
+
+
 def _get_or_create_shared_material(puppet_name):
     """
     Get or create a shared stroke material for a puppet's GP objects.
     Reuses the same material across all GP objects for consistency.
     """
+    # Cached material, unless it has since been removed or renamed
+    mat = bpy.data.materials.get(_MAT_CACHE.get(puppet_name, ""))
+    if mat is not None:
+        return mat
+
     stroke_name = f"{puppet_name}_Stroke"
 
     # Reuse existing material if it exists
     mat = bpy.data.materials.get(stroke_name)
     if mat:
+        _MAT_CACHE[puppet_name] = mat.name
         return mat
 
     # Create new stroke material
@@ -249,9 +389,22 @@ def _get_or_create_shared_material(puppet_name):
         except Exception:
             pass
 
+    _MAT_CACHE[puppet_name] = mat.name
     return mat
 
 
+def _get_puppet_collection(armature_obj, context):
+    """
+    Get the collection that holds a puppet's GP objects.
+    Falls back to the context collection if the puppet's collection is gone.
+    """
+    col_name = armature_obj.get("puppet_collection", "")
+    collection = bpy.data.collections.get(col_name)
+    if collection:
+        return collection
+    return context.collection
+
+
 def create_gp_for_layer(armature_obj, layer_name, context):
     """
     Create a single GP object for one drawable layer.
@@ -277,40 +430,31 @@ def create_gp_for_layer(armature_obj, layer_name, context):
     gp_name = get_gp_object_name(puppet_name, layer_name)
 
     # Create GP data block
-    if is_gp_v3():
-        try:
-            if hasattr(bpy.data, 'grease_pencils_v3'):
-                gp_data = bpy.data.grease_pencils_v3.new(gp_name)
-            else:
-                gp_data = bpy.data.grease_pencils.new(gp_name)
-        except Exception:
-            gp_data = bpy.data.grease_pencils.new(gp_name)
-    else:
-        gp_data = bpy.data.grease_pencils.new(gp_name)
+    gp_data = _new_gp_data(gp_name)
 
     gp_obj = bpy.data.objects.new(gp_name, gp_data)
 
+    caps = _get_gp_caps(gp_data)
+
     # Create the single drawing layer
     try:
-        if hasattr(gp_data.layers, 'new'):
-            try:
-                layer = gp_data.layers.new(name=layer_name)
-            except TypeError:
-                layer = gp_data.layers.new(layer_name)
+        if caps['has_layers_new']:
+            layer = _new_gp_layer(gp_data, layer_name)
 
-            if hasattr(layer, 'hide'):
+            caps = _get_gp_caps(gp_data, layer)
+            if caps['has_hide']:
                 layer.hide = False
-            if hasattr(layer, 'opacity'):
+            if caps['has_opacity']:
                 layer.opacity = 1.0
 
             # Legacy GP needs an initial frame
-            if not is_gp_v3() and hasattr(layer, 'frames'):
+            if caps['needs_initial_frame']:
                 layer.frames.new(1)
     except Exception as e:
         print(f"Puppet Mode: Could not create layer for {layer_name}: {e}")
 
     # Disable autolock
-    if hasattr(gp_data, 'use_autolock_layers'):
+    if caps['has_autolock']:
         gp_data.use_autolock_layers = False
 
     # Set active layer
@@ -318,17 +462,11 @@ def create_gp_for_layer(armature_obj, layer_name, context):
         gp_data.layers.active = gp_data.layers[0]
 
     # Assign shared material
-    mat = _get_or_create_shared_material(puppet_name)
-    gp_data.materials.append(mat)
+    gp_data.materials.append(_get_or_create_shared_material(puppet_name))
     gp_obj.active_material_index = 0
 
     # Link to puppet's collection (scene collection as fallback)
-    col_name = armature_obj.get("puppet_collection", "")
-    collection = bpy.data.collections.get(col_name)
-    if collection:
-        collection.objects.link(gp_obj)
-    else:
-        context.collection.objects.link(gp_obj)
+    _get_puppet_collection(armature_obj, context).objects.link(gp_obj)
 
     # Parent to armature
     gp_obj.parent = armature_obj
@@ -341,6 +479,9 @@ def create_gp_for_layer(armature_obj, layer_name, context):
     gp_obj["puppet_rig"] = armature_obj.name
     gp_obj["puppet_layer"] = layer_name
 
+    # The puppet's part list changed
+    invalidate_puppet_gp_cache(armature_obj)
+
     return gp_obj
 
 
@@ -355,16 +496,22 @@ def find_or_create_gp_for_layer(armature_obj, layer_name, context):
         context: Blender context
 
     Returns:
-        The GP object for this layer
+        Tuple of (gp_obj, all_gps): the GP object for this layer and the
+        puppet's full (gp_obj, layer_name) list, so callers don't scan again
     """
     puppet_name = armature_obj["puppet_name"]
     gp_name = get_gp_object_name(puppet_name, layer_name)
 
+    all_gps = get_puppet_gp_objects_cached(armature_obj)
+
     existing = bpy.data.objects.get(gp_name)
     if existing:
-        return existing
+        return existing, all_gps
 
-    return create_gp_for_layer(armature_obj, layer_name, context)
+    gp_obj = create_gp_for_layer(armature_obj, layer_name, context)
+    all_gps = all_gps + [(gp_obj, layer_name)]
+    _store_puppet_gp_cache(armature_obj, all_gps)
+    return gp_obj, all_gps
 
 
 def get_puppet_gp_objects(armature_obj):
@@ -382,6 +529,47 @@ def get_puppet_gp_objects(armature_obj):
     return results
 
 
+def get_puppet_gp_objects_cached(armature_obj):
+    """
+    Like get_puppet_gp_objects, but reads the part list stored on the
+    armature ("_gp_cache", a JSON list of [gp_name, layer_name]) instead of
+    scanning every object. Falls back to a scan, and rewrites the cache,
+    when it is missing or names an object that no longer exists.
+    """
+    if not armature_obj:
+        return []
+
+    cached = armature_obj.get("_gp_cache")
+    if cached:
+        objects = bpy.data.objects
+        results = []
+        for gp_name, layer_name in json.loads(cached):
+            gp_obj = objects.get(gp_name)
+            if gp_obj is None:
+                results = None
+                break
+            results.append((gp_obj, layer_name))
+        if results is not None:
+            return results
+
+    results = get_puppet_gp_objects(armature_obj)
+    _store_puppet_gp_cache(armature_obj, results)
+    return results
+
+
+def _store_puppet_gp_cache(armature_obj, results):
+    """Write a (gp_obj, layer_name) list to the armature's part cache."""
+    armature_obj["_gp_cache"] = json.dumps(
+        [(gp_obj.name, layer_name) for gp_obj, layer_name in results]
+    )
+
+
+def invalidate_puppet_gp_cache(armature_obj):
+    """Drop the cached part list after GP objects are created or removed."""
+    if "_gp_cache" in armature_obj:
+        del armature_obj["_gp_cache"]
+
+
 # ----------------------------------------------------------------------------
 # PUPPET ASSEMBLY
 # ----------------------------------------------------------------------------
@@ -409,7 +597,7 @@ def create_puppet(context, base_name="Puppet"):
     puppet_name = get_unique_name(base_name, existing_names)
 
     # Deselect all objects first (without using operators)
-    deselect_all_objects()
+    deselect_all_objects(context)
 
     # Create the armature (this will be the "master" object)
     armature_obj = create_armature(puppet_name, context)
@@ -426,22 +614,79 @@ def create_puppet(context, base_name="Puppet"):
     # Position in 3D view (at world origin, facing -Y)
     armature_obj.location = (0, 0, 0)
 
+    register_puppet(armature_obj)
+
     # ----- 2D ANIMATION MODE SETUP -----
 
+    # Resolve the 3D viewport once for both view helpers
+    region_3d = _first_view3d_space(context)
+
     # Set view to Front Orthographic (standard 2D animation view)
-    setup_2d_view(context)
+    setup_2d_view(context, region_3d)
 
     # Frame the puppet in view
-    frame_puppet_in_view(context, armature_obj)
+    frame_puppet_in_view(context, armature_obj, region_3d)
 
-    # Select armature and make it active
-    deselect_all_objects()
-    armature_obj.select_set(True)
-    context.view_layer.objects.active = armature_obj
+    # create_armature() already left the armature as the only selected,
+    # active object, so no second deselect/select pass is needed here
+    if context.view_layer.objects.active != armature_obj:
+        context.view_layer.objects.active = armature_obj
 
     return armature_obj
 
 
+# ----------------------------------------------------------------------------
+# PUPPET REGISTRY
+# Names of puppet armatures, so the panel does not scan every object in the
+# file on each redraw. Rebuilt with a full scan when stale or after load.
+# ----------------------------------------------------------------------------
+
+_SCENE_PUPPETS = set()
+_puppets_indexed = False
+
+# len(bpy.data.objects) at the last scan; a change means objects were
+# added (e.g. duplicated or appended puppets) or removed since
+_indexed_object_count = -1
+
+# Bumped whenever the registry contents change, for callers that cache
+_registry_version = 0
+
+
+def get_puppet_registry_version():
+    """Return a counter that changes whenever the puppet registry does."""
+    return _registry_version
+
+
+def _index_puppets():
+    """Rebuild the puppet registry with one scan over bpy.data.objects."""
+    global _puppets_indexed, _registry_version, _indexed_object_count
+    _SCENE_PUPPETS.clear()
+    objects = bpy.data.objects
+    for obj in objects:
+        if obj.type == 'ARMATURE' and obj.get("is_puppet"):
+            _SCENE_PUPPETS.add(obj.name)
+    _indexed_object_count = len(objects)
+    _puppets_indexed = True
+    _registry_version += 1
+
+
+def invalidate_puppet_cache():
+    """Mark the puppet registry stale; the next lookup rescans."""
+    global _puppets_indexed, _registry_version
+    _puppets_indexed = False
+    _registry_version += 1
+
+
+def register_puppet(armature_obj):
+    """Add a newly created puppet armature to the registry."""
+    global _registry_version, _indexed_object_count
+    _SCENE_PUPPETS.add(armature_obj.name)
+    # The new armature is accounted for, so the count check shouldn't
+    # throw the index away on the next depsgraph update
+    _indexed_object_count = len(bpy.data.objects)
+    _registry_version += 1
+
+
 def get_puppets_in_scene():
     """
     Find all puppet rigs in the current scene.
@@ -449,8 +694,60 @@ def get_puppets_in_scene():
     Returns:
         List of armature objects that are puppets
     """
-    puppets = []
-    for obj in bpy.data.objects:
-        if obj.type == 'ARMATURE' and obj.get("is_puppet"):
-            puppets.append(obj)
-    return puppets
+    if not _puppets_indexed:
+        _index_puppets()
+
+    objects = bpy.data.objects
+    return [objects[name] for name in sorted(_SCENE_PUPPETS) if name in objects]
+
+
+@persistent
+def _prune_puppet_registry(scene, depsgraph):
+    """
+    Drop the registry when objects were added or removed, or a tracked
+    puppet was renamed. Updates that touch no objects are ignored.
+    """
+    if not _puppets_indexed or not depsgraph.id_type_updated('OBJECT'):
+        return
+    objects = bpy.data.objects
+    if len(objects) != _indexed_object_count:
+        invalidate_puppet_cache()
+        return
+    for name in _SCENE_PUPPETS:
+        if name not in objects:
+            invalidate_puppet_cache()
+            return
+
+
+@persistent
+def _reset_puppet_registry(*args):
+    """Force a rescan after a new file is loaded."""
+    _SCENE_PUPPETS.clear()
+    invalidate_puppet_cache()
+
+
+@persistent
+def _clear_material_cache(*args):
+    """Drop cached material names, which belong to the previous file."""
+    _MAT_CACHE.clear()
+
+
+# ----------------------------------------------------------------------------
+# REGISTRATION
+# ----------------------------------------------------------------------------
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_prune_puppet_registry)
+    bpy.app.handlers.load_post.append(_reset_puppet_registry)
+    bpy.app.handlers.load_post.append(_clear_material_cache)
+
+
+def unregister():
+    if _clear_material_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_material_cache)
+    if _reset_puppet_registry in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_reset_puppet_registry)
+    if _prune_puppet_registry in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_prune_puppet_registry)
+    _reset_puppet_registry()
+    _clear_material_cache()
@@ -0,0 +1,131 @@
+# core/scene_cache.py
+# ============================================================================
+# Cached lookups for puppet objects in the current scene.
+# Operators poll on every redraw, so these avoid scanning objects whenever a
+# remembered name or the puppet registry can answer instead. Names resolve
+# through bpy.data.objects (a keyed lookup, unlike scene.objects) and are
+# then scoped to context.scene, where a puppet's rig and parts always live.
+# ============================================================================
+
+import bpy
+from bpy.app.handlers import persistent
+
+from ..constants import GP_OBJECT_TYPES
+from .rig_builder import get_puppets_in_scene
+
+
+def get_scene_object(context, name):
+    """
+    Return the object called name if it is linked into context.scene.
+    bpy.data.objects is a keyed lookup; the users_scene check keeps rigs
+    from other scenes (or left orphaned) from being picked up.
+    """
+    obj = bpy.data.objects.get(name)
+    if obj is not None and context.scene in obj.users_scene:
+        return obj
+    return None
+
+
+def get_puppet_armature(context, remember=True):
+    """
+    Find the puppet armature from whatever is currently selected.
+
+    The result is remembered on puppet_selector.active_puppet_name so later
+    calls resolve with one lookup instead of scanning every object. Pass
+    remember=False from poll(), where ID properties cannot be written.
+    """
+    obj = context.active_object
+    armature = None
+
+    if obj:
+        # Direct armature selection
+        if obj.type == 'ARMATURE' and obj.get("is_puppet"):
+            armature = obj
+
+        # GP object -> find its armature
+        elif obj.type in GP_OBJECT_TYPES and obj.get("puppet_rig"):
+            armature = get_scene_object(context, obj["puppet_rig"])
+
+    props = context.scene.puppet_selector
+
+    # Last known puppet
+    if armature is None and props.active_puppet_name:
+        cached = get_scene_object(context, props.active_puppet_name)
+        if cached and cached.type == 'ARMATURE' and cached.get("is_puppet"):
+            return cached
+
+    # Fallback: any puppet armature from the registry that is in this scene
+    if armature is None:
+        armature = next(
+            (rig for rig in get_puppets_in_scene()
+             if context.scene in rig.users_scene),
+            None,
+        )
+
+    if armature is not None and remember and props.active_puppet_name != armature.name:
+        props.active_puppet_name = armature.name
+
+    return armature
+
+
+# ----------------------------------------------------------------------------
+# ACTIVE PUPPET (no fallbacks)
+# ----------------------------------------------------------------------------
+
+# Last active object's pointer and what it resolved to:
+# (pointer, is_rig, rig_name). is_rig means the object is the armature itself.
+# Names are stored rather than objects so undo can't leave dead references;
+# cleared on every depsgraph update, so only redraws in between hit it.
+_NO_ACTIVE = (0, False, None)
+_last_active = _NO_ACTIVE
+
+
+def _resolve_puppet(obj):
+    """Return (is_rig, rig_name) for obj; rig_name is None if not a puppet."""
+    if obj.type == 'ARMATURE' and obj.get("is_puppet"):
+        return True, obj.name
+    if obj.type in GP_OBJECT_TYPES and obj.get("puppet_rig"):
+        return False, obj["puppet_rig"]
+    return False, None
+
+
+def get_active_puppet(context):
+    """
+    Return the puppet armature owning the active object, or None.
+
+    Unlike get_puppet_armature() this never falls back to another puppet,
+    and it is safe to call from draw() since it writes no ID properties.
+    """
+    global _last_active
+    obj = context.active_object
+    if obj is None:
+        return None
+
+    pointer = obj.as_pointer()
+    if _last_active[0] == pointer:
+        _, is_rig, rig_name = _last_active
+    else:
+        is_rig, rig_name = _resolve_puppet(obj)
+        _last_active = (pointer, is_rig, rig_name)
+
+    if is_rig:
+        return obj
+    if rig_name is None:
+        return None
+    return get_scene_object(context, rig_name)
+
+
+@persistent
+def _clear_active_puppet_cache(*args):
+    global _last_active
+    _last_active = _NO_ACTIVE
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_clear_active_puppet_cache)
+
+
+def unregister():
+    if _clear_active_puppet_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_clear_active_puppet_cache)
+    _clear_active_puppet_cache()
@@ -9,7 +9,7 @@ from bpy.types import Operator
 from bpy.props import StringProperty
 
 from ..core.rig_builder import create_puppet, get_puppets_in_scene
-from ..constants import get_total_drawable_parts
+from ..constants import TOTAL_DRAWABLE_PARTS
 
 
 class PUPPET_OT_create_puppet(Operator):
@@ -34,11 +34,10 @@ class PUPPET_OT_create_puppet(Operator):
             armature_obj = create_puppet(context, self.puppet_name)
 
             # Report success
-            total_parts = get_total_drawable_parts()
             self.report(
                 {'INFO'},
                 f"Created puppet '{armature_obj['puppet_name']}' "
-                f"with {total_parts} drawable parts"
+                f"with {TOTAL_DRAWABLE_PARTS} drawable parts"
             )
 
             return {'FINISHED'}
@@ -61,9 +60,8 @@ class PUPPET_OT_create_puppet(Operator):
 # REGISTRATION
 # ----------------------------------------------------------------------------
 
-def register():
-    bpy.utils.register_class(PUPPET_OT_create_puppet)
+classes = [
+    PUPPET_OT_create_puppet,
+]
 
-
-def unregister():
-    bpy.utils.unregister_class(PUPPET_OT_create_puppet)
+register, unregister = bpy.utils.register_classes_factory(classes)
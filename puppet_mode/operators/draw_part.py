@@ -12,6 +12,8 @@
 # - Drawings persist naturally because each GP object is independent
 # ============================================================================
 
+import json
+
 import bpy
 from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty
@@ -20,36 +22,180 @@ from ..core.properties import (
     get_current_layer_name,
     get_view_layer_names,
 )
+from ..core.rig_builder import is_gp_v3
+from ..core.scene_cache import get_puppet_armature
+
+
+# Paint mode name differs between GP v3 (Blender 4.3+) and legacy GP.
+# Resolved once at import so entering draw mode never probes via exceptions.
+_GP_PAINT_MODE = 'PAINT_GREASE_PENCIL' if is_gp_v3() else 'PAINT_GPENCIL'
+
 
+# Scene ID property holding the last DRAW visibility state (JSON)
+_DRAW_STATE_KEY = "_puppet_last_draw"
 
-def get_puppet_armature(context):
-    """Find the puppet armature from whatever is currently selected."""
-    obj = context.active_object
-    gp_types = ('GPENCIL', 'GREASEPENCIL')
 
-    if obj:
-        # Direct armature selection
-        if obj.type == 'ARMATURE' and obj.get("is_puppet"):
-            return obj
+def clear_draw_state(context):
+    """Forget the last DRAW state after visibility changed elsewhere."""
+    if _DRAW_STATE_KEY in context.scene:
+        del context.scene[_DRAW_STATE_KEY]
 
-        # GP object -> find its armature
-        if obj.type in gp_types and obj.get("puppet_rig"):
-            rig_name = obj["puppet_rig"]
-            if rig_name in bpy.data.objects:
-                return bpy.data.objects[rig_name]
 
-    # Fallback: search all objects for any puppet armature
-    for o in bpy.data.objects:
-        if o.type == 'ARMATURE' and o.get("is_puppet"):
-            return o
+# Coalesced view refresh: rapid clicks schedule at most one refresh
+_pending_refresh = False
 
+
+def _run_pending_refresh():
+    """Timer callback: apply the current view's visibility once."""
+    global _pending_refresh
+    if not _pending_refresh:
+        return None
+    _pending_refresh = False
+    context = bpy.context
+    armature = get_puppet_armature(context)
+    if armature:
+        apply_view_visibility(context, armature)
     return None
 
 
+def schedule_view_visibility():
+    """
+    Refresh the current view's visibility shortly in the future.
+    Calls made while one is already pending are folded into it.
+    """
+    global _pending_refresh
+    if _pending_refresh:
+        return
+    _pending_refresh = True
+    # Persistent so a file load can't drop the timer and leave the flag set
+    bpy.app.timers.register(
+        _run_pending_refresh, first_interval=0.05, persistent=True
+    )
+
+
+def cancel_view_visibility():
+    """Drop a pending refresh (called when the add-on is unregistered)."""
+    global _pending_refresh
+    _pending_refresh = False
+    if bpy.app.timers.is_registered(_run_pending_refresh):
+        bpy.app.timers.unregister(_run_pending_refresh)
+
+
+def _deselect_all(context):
+    """
+    Clear the selection with one bulk operator call.
+    Falls back to deselecting only the currently selected objects if the
+    operator can't run in this context.
+    """
+    try:
+        bpy.ops.object.select_all(action='DESELECT')
+    except RuntimeError:
+        for obj in context.selected_objects[:]:
+            obj.select_set(False)
+
+
+def select_only(context, obj):
+    """
+    Make obj the only selected object and the active one.
+    Nothing is deselected when obj is already the sole selection, which is
+    the common case on repeated clicks.
+    """
+    selected = context.selected_objects
+    if len(selected) != 1 or selected[0] != obj:
+        _deselect_all(context)
+        obj.select_set(True)
+    if context.view_layer.objects.active != obj:
+        context.view_layer.objects.active = obj
+
+
+def _ensure_object_mode(context):
+    """Switch back to Object mode, only if we're in another mode."""
+    if context.mode == 'OBJECT' or context.active_object is None:
+        return
+    try:
+        bpy.ops.object.mode_set(mode='OBJECT')
+    except RuntimeError:
+        pass
+
+
+def _enter_draw_mode(context, gp_obj):
+    """
+    Enter Grease Pencil paint mode on gp_obj.
+    The mode name is resolved once at import (_GP_PAINT_MODE), and the
+    target is pinned as the context object for the mode switch.
+    """
+    with context.temp_override(
+        active_object=gp_obj,
+        object=gp_obj,
+        selected_objects=[gp_obj],
+    ):
+        try:
+            bpy.ops.object.mode_set(mode=_GP_PAINT_MODE)
+        except RuntimeError as e:
+            print(f"Puppet Mode: Could not enter draw mode: {e}")
+
+
+def _set_part_opacity(gp_obj, opacity):
+    """
+    Set the opacity of a part's single layer if it differs.
+    Each part's GP object has exactly one layer, so there is no per-layer
+    loop to batch; unchanged values are skipped so repeated clicks don't
+    re-tag every part for update.
+    """
+    layers = gp_obj.data.layers
+    if layers and layers[0].opacity != opacity:
+        layers[0].opacity = opacity
+
+
+def _set_part_hidden(gp_obj, hide):
+    """
+    Set hide_viewport on a part if it differs.
+    Written through the RNA setter so hide_viewport's update callbacks
+    fire; unchanged values are skipped so only parts that actually flip
+    get re-tagged.
+    """
+    if gp_obj.hide_viewport != hide:
+        gp_obj.hide_viewport = hide
+
+
 # ----------------------------------------------------------------------------
 # VIEW THIS VIEW - Show ALL drawn parts for current view
 # ----------------------------------------------------------------------------
 
+def apply_view_visibility(context, armature):
+    """
+    Show the puppet's drawn parts for the current view + hand pose at full
+    opacity and hide the rest. Called directly (not through bpy.ops) by
+    anything that only needs the visibility refresh.
+
+    Returns:
+        Number of parts shown
+    """
+    # Get layers relevant to current view + hand pose
+    relevant_layers = get_view_layer_names(context)
+
+    from ..core.rig_builder import get_puppet_gp_objects_cached
+    all_gps = get_puppet_gp_objects_cached(armature)
+    shown = 0
+
+    active = context.active_object
+    for gp_obj, gp_layer in all_gps:
+        visible = gp_layer in relevant_layers
+        if not visible and gp_obj == active:
+            # Don't hide the part being drawn while still in paint mode
+            _ensure_object_mode(context)
+            select_only(context, armature)
+        _set_part_hidden(gp_obj, not visible)
+        if visible:
+            _set_part_opacity(gp_obj, 1.0)
+            if gp_obj.hide_render:
+                gp_obj.hide_render = False
+            shown += 1
+
+    clear_draw_state(context)
+    return shown
+
+
 class PUPPET_OT_view_part(Operator):
     """Show all drawn parts as an assembled character"""
 
@@ -60,7 +206,7 @@ class PUPPET_OT_view_part(Operator):
 
     @classmethod
     def poll(cls, context):
-        return get_puppet_armature(context) is not None
+        return get_puppet_armature(context, remember=False) is not None
 
     def execute(self, context):
         """Show drawn GP objects for the current view at full opacity."""
@@ -70,35 +216,13 @@ class PUPPET_OT_view_part(Operator):
             return {'CANCELLED'}
 
         # Exit any current mode
-        if context.active_object and context.active_object.mode != 'OBJECT':
-            try:
-                bpy.ops.object.mode_set(mode='OBJECT')
-            except:
-                pass
-
-        # Get layers relevant to current view + hand pose
-        relevant_layers = get_view_layer_names(context)
+        _ensure_object_mode(context)
 
         # Show/hide GP objects based on current view
-        from ..core.rig_builder import get_puppet_gp_objects
-        all_gps = get_puppet_gp_objects(armature)
-        shown = 0
-
-        for gp_obj, gp_layer in all_gps:
-            if gp_layer in relevant_layers:
-                gp_obj.hide_viewport = False
-                gp_obj.hide_render = False
-                if gp_obj.data.layers:
-                    gp_obj.data.layers[0].opacity = 1.0
-                shown += 1
-            else:
-                gp_obj.hide_viewport = True
+        shown = apply_view_visibility(context, armature)
 
         # Select armature
-        for obj in bpy.data.objects:
-            obj.select_set(False)
-        armature.select_set(True)
-        context.view_layer.objects.active = armature
+        select_only(context, armature)
 
         self.report({'INFO'}, f"Viewing {shown} drawn parts")
         return {'FINISHED'}
@@ -125,7 +249,7 @@ class PUPPET_OT_draw_part(Operator):
 
     @classmethod
     def poll(cls, context):
-        return get_puppet_armature(context) is not None
+        return get_puppet_armature(context, remember=False) is not None
 
     def execute(self, context):
         """Find or create the GP object for this part and enter draw mode."""
@@ -141,53 +265,45 @@ class PUPPET_OT_draw_part(Operator):
             layer_name = get_current_layer_name(context)
 
         props = context.scene.puppet_selector
-        ref_opacity = getattr(props, 'reference_opacity', 0.3)
+        ref_opacity = props.reference_opacity
 
         # Get/create the GP object for this part (on-demand creation)
-        from ..core.rig_builder import find_or_create_gp_for_layer, get_puppet_gp_objects
-        target_gp = find_or_create_gp_for_layer(armature, layer_name, context)
+        from ..core.rig_builder import find_or_create_gp_for_layer
+        target_gp, all_gps = find_or_create_gp_for_layer(armature, layer_name, context)
 
         # Get layers relevant to current view
         relevant_layers = get_view_layer_names(context)
 
-        # Set visibility for all puppet GP objects
-        all_gps = get_puppet_gp_objects(armature)
-        for gp_obj, gp_layer in all_gps:
-            if gp_obj == target_gp:
-                # Target: full opacity, visible
-                gp_obj.hide_viewport = False
-                if gp_obj.data.layers:
-                    gp_obj.data.layers[0].opacity = 1.0
-            elif gp_layer in relevant_layers:
-                # Same view, different part: show as reference
-                gp_obj.hide_viewport = False
-                if gp_obj.data.layers:
-                    gp_obj.data.layers[0].opacity = ref_opacity
-            else:
-                # Different view: hide
-                gp_obj.hide_viewport = True
+        # Skip the visibility pass when re-drawing the same target with the
+        # same settings as the last DRAW
+        draw_state = json.dumps(
+            [target_gp.name, layer_name, ref_opacity, sorted(relevant_layers)]
+        )
+        active_layer = target_gp.data.layers.active
+        if (context.scene.get(_DRAW_STATE_KEY) != draw_state
+                or active_layer is None or active_layer.name != layer_name):
+            # Set visibility for all puppet GP objects
+            for gp_obj, gp_layer in all_gps:
+                if gp_obj == target_gp:
+                    # Target: full opacity, visible
+                    visible, opacity = True, 1.0
+                else:
+                    # Same view, different part: show as reference
+                    # Different view: hide
+                    visible, opacity = gp_layer in relevant_layers, ref_opacity
+                _set_part_hidden(gp_obj, not visible)
+                if visible:
+                    _set_part_opacity(gp_obj, opacity)
+            context.scene[_DRAW_STATE_KEY] = draw_state
 
         # Exit any current mode
-        if context.active_object and context.active_object.mode != 'OBJECT':
-            try:
-                bpy.ops.object.mode_set(mode='OBJECT')
-            except:
-                pass
+        _ensure_object_mode(context)
 
         # Select the target GP object
-        for obj in bpy.data.objects:
-            obj.select_set(False)
-        target_gp.select_set(True)
-        context.view_layer.objects.active = target_gp
+        select_only(context, target_gp)
 
         # Enter paint mode
-        try:
-            bpy.ops.object.mode_set(mode='PAINT_GREASE_PENCIL')
-        except TypeError:
-            try:
-                bpy.ops.object.mode_set(mode='PAINT_GPENCIL')
-            except Exception as e:
-                print(f"Puppet Mode: Could not enter draw mode: {e}")
+        _enter_draw_mode(context, target_gp)
 
         self.report({'INFO'}, f"Drawing: {layer_name}")
         return {'FINISHED'}
@@ -221,11 +337,16 @@ class PUPPET_OT_set_rotation(Operator):
     def execute(self, context):
         """Set the rotation property and optionally view it."""
         props = context.scene.puppet_selector
+
+        # Already selected: nothing to write or refresh
+        if props.rotation == self.rotation:
+            return {'CANCELLED'}
+
         props.rotation = self.rotation
 
         # Auto-view when clicking on rotation grid
         if self.auto_view:
-            bpy.ops.puppet.view_part()
+            schedule_view_visibility()
 
         return {'FINISHED'}
 
@@ -251,7 +372,7 @@ class PUPPET_OT_toggle_onion(Operator):
 
         # Refresh the view if a puppet is active
         if get_puppet_armature(context):
-            bpy.ops.puppet.view_part()
+            schedule_view_visibility()
 
         status = "ON" if props.onion_skin_enabled else "OFF"
         self.report({'INFO'}, f"Onion skin: {status}")
@@ -269,12 +390,4 @@ classes = [
     PUPPET_OT_toggle_onion,
 ]
 
-
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
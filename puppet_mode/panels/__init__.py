@@ -6,11 +6,13 @@
 
 from .main_panel import (
     PUPPET_PT_main_panel,
+    PUPPET_PT_outliner_panel,
     PUPPET_OT_select_puppet,
 )
 
 # List of all panel classes to register
 panel_classes = [
     PUPPET_PT_main_panel,
+    PUPPET_PT_outliner_panel,
     PUPPET_OT_select_puppet,
 ]
@@ -9,26 +9,194 @@
 # - Visibility toggles use hide_viewport on GP objects
 # ============================================================================
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 import bpy
 from bpy.types import Panel, Operator
 
-from ..core.rig_builder import get_puppets_in_scene
+from ..core.rig_builder import get_puppets_in_scene, get_puppet_registry_version
+from ..core.scene_cache import get_active_puppet, get_scene_object
+from ..operators.draw_part import (
+    clear_draw_state,
+    schedule_view_visibility,
+    select_only,
+)
 from ..core.properties import (
-    get_current_layer_name,
-    is_layer_drawn,
-    count_drawn_parts,
+    get_drawn_layer_names,
 )
 from ..constants import (
-    get_total_drawable_parts,
     get_gp_object_name,
     CHARACTER_VIEWS,
-    DRAWABLE_PARTS,
     VIEW_DEPENDENT_PARTS,
     OUTLINER_PARTS,
-    HAND_POSES,
+    PART_TO_REGION,
+    TOTAL_DRAWABLE_PARTS,
+    LAYER_NAME,
 )
 
 
+# Nicer labels for the view buttons (computed once, not per redraw)
+_VIEW_LABEL_OVERRIDES = {
+    'Quarter_L': "3/4 L",
+    'Quarter_R': "3/4 R",
+    'Profile_L': "Side L",
+    'Profile_R': "Side R",
+}
+VIEW_LABELS = {
+    view: _VIEW_LABEL_OVERRIDES.get(view) or view.replace('_', ' ')
+    for view in CHARACTER_VIEWS
+}
+
+# View button icon by (is_current, view_has_content)
+VIEW_ICON_BY_STATE = {
+    (True, True): 'RADIOBUT_ON',
+    (True, False): 'RADIOBUT_ON',
+    (False, True): 'CHECKBOX_HLT',
+    (False, False): 'CHECKBOX_DEHLT',
+}
+
+# Per-row icon picks, indexed by the boolean they depend on
+POSE_ICON = {True: 'RADIOBUT_ON', False: 'RADIOBUT_OFF'}        # is current
+HIDDEN_ICON = {True: 'HIDE_ON', False: 'HIDE_OFF'}              # hide_viewport
+DRAWN_ICON = {True: 'CHECKMARK', False: 'DOT'}                  # GP object exists
+SELECTED_ICON = {True: 'LAYER_ACTIVE', False: 'LAYER_USED'}     # part selected
+
+
+# Puppet names for the "no puppet selected" list, reused across redraws.
+# Names (not objects) are cached so undo/delete can't leave dead references.
+_puppets_cache = {"key": None, "val": []}
+
+
+def _get_puppets_cached(context):
+    """
+    Return get_puppets_in_scene(), recomputed only when the object count,
+    scene, or puppet registry has changed since the last redraw.
+    """
+    objects = bpy.data.objects
+    key = (len(objects), context.scene.name, get_puppet_registry_version())
+    if _puppets_cache["key"] != key:
+        _puppets_cache["val"] = [p.name for p in get_puppets_in_scene()]
+        _puppets_cache["key"] = key
+    return [objects[name] for name in _puppets_cache["val"] if name in objects]
+
+
+# Drawn layers + per-view content flags from the last redraw. Mouse-move
+# redraws see the same puppet and object count, so they reuse these.
+_drawn_state_cache = {"key": None, "drawn_layers": frozenset(), "content_map": {}}
+
+
+def _get_drawn_state(puppet):
+    """
+    Return (drawn_layers, content_map) for puppet, recomputed only when the
+    puppet or the object count changed since the last redraw.
+    """
+    key = (puppet.as_pointer(), puppet.get("puppet_name", ""), len(bpy.data.objects))
+    if _drawn_state_cache["key"] != key:
+        drawn_layers = get_drawn_layer_names(puppet)
+        _drawn_state_cache["drawn_layers"] = drawn_layers
+        _drawn_state_cache["content_map"] = {
+            view: _view_has_content(drawn_layers, view)
+            for view in CHARACTER_VIEWS
+        }
+        _drawn_state_cache["key"] = key
+    return _drawn_state_cache["drawn_layers"], _drawn_state_cache["content_map"]
+
+
+def _view_has_content(drawn_layers, view):
+    """Check if any parts have been drawn for a given view."""
+    for part in VIEW_DEPENDENT_PARTS:
+        if f"{part}_{view}" in drawn_layers:
+            return True
+    return False
+
+
+@dataclass(slots=True, frozen=True)
+class DrawState:
+    """
+    Everything the main panel shows that is derived from puppet state:
+    labels, icons and flags, resolved so draw() only issues layout calls.
+    """
+
+    puppet_label: str       # Puppet display name
+    parts_label: str        # "Parts Drawn: n/total"
+    progress: float         # 0..1 factor for the progress bar
+    progress_text: str      # "n%"
+    view_buttons: tuple     # ((view, label, icon), ...)
+    pose_buttons: tuple     # ((pose, icon), ...); empty unless a hand is selected
+    layer_name: str         # Current selection's layer name
+    layer_icon: str         # CHECKMARK if drawn, else LAYER_ACTIVE
+    draw_text: str          # "DRAW" or "EDIT"
+
+
+def _progress_labels(drawn):
+    progress = drawn / TOTAL_DRAWABLE_PARTS
+    return (f"Parts Drawn: {drawn}/{TOTAL_DRAWABLE_PARTS}", progress,
+            f"{int(progress * 100)}%")
+
+
+# Header (label, factor, percent text) for every possible drawn count
+_PROGRESS_LABELS = tuple(_progress_labels(n) for n in range(TOTAL_DRAWABLE_PARTS + 1))
+
+# Last computed DrawState and the signature it was computed for
+_state_cache = {"key": None, "state": None}
+
+
+def _compute_state(props, puppet):
+    """
+    Return the DrawState for puppet and the current selection.
+    Reused while the puppet, object count and selection props are unchanged,
+    which covers the redraws triggered by mouse movement.
+    """
+    view = props.character_view
+    part = props.part
+    hand_pose = props.hand_pose
+    puppet_name = puppet.get("puppet_name", "")
+    key = (puppet.as_pointer(), puppet_name, len(bpy.data.objects),
+           view, part, hand_pose)
+    if _state_cache["key"] == key:
+        return _state_cache["state"]
+
+    drawn_layers, content_map = _get_drawn_state(puppet)
+
+    # Header progress
+    parts_label, progress, progress_text = _PROGRESS_LABELS[len(drawn_layers)]
+
+    # View buttons: icon shows current view and whether it has content
+    view_buttons = tuple(
+        (v, VIEW_LABELS[v], VIEW_ICON_BY_STATE[(v == view, content_map[v])])
+        for v in CHARACTER_VIEWS
+    )
+
+    # Hand pose buttons (only for hands)
+    pose_buttons = ()
+    if part.startswith('Hand_'):
+        from ..constants import HAND_POSES
+
+        pose_buttons = tuple(
+            (pose, POSE_ICON[pose == hand_pose]) for pose in HAND_POSES
+        )
+
+    # Current selection (same lookup as get_current_layer_name, inlined)
+    layer_name = LAYER_NAME.get((part, view, hand_pose), part)
+    is_drawn = layer_name in drawn_layers
+
+    state = DrawState(
+        puppet_label=puppet_name,
+        parts_label=parts_label,
+        progress=progress,
+        progress_text=progress_text,
+        view_buttons=view_buttons,
+        pose_buttons=pose_buttons,
+        layer_name=layer_name,
+        layer_icon='CHECKMARK' if is_drawn else 'LAYER_ACTIVE',
+        draw_text="EDIT" if is_drawn else "DRAW",
+    )
+    _state_cache["key"] = key
+    _state_cache["state"] = state
+    return state
+
+
 class PUPPET_PT_main_panel(Panel):
     """Main Puppet Mode panel in the 3D View sidebar"""
 
@@ -43,7 +211,7 @@ class PUPPET_PT_main_panel(Panel):
         props = context.scene.puppet_selector
 
         # Get active puppet armature
-        active_puppet = self._get_active_puppet(context)
+        active_puppet = get_active_puppet(context)
 
         # --------------------------------------------------------------------
         # NO PUPPET SELECTED
@@ -52,120 +220,36 @@ class PUPPET_PT_main_panel(Panel):
             self._draw_no_puppet(layout, context)
             return
 
+        # All derived labels/icons, reused across redraws when unchanged
+        state = _compute_state(props, active_puppet)
+        self._emit_layout(layout, props, state)
+
+        # Mini-outliner lives in PUPPET_PT_outliner_panel (collapsible)
+
+    def _emit_layout(self, layout, props, state):
+        """Issue the layout calls for a puppet's panel from its DrawState."""
         # --------------------------------------------------------------------
         # PUPPET HEADER
         # --------------------------------------------------------------------
-        self._draw_puppet_header(layout, active_puppet)
+        box = layout.box()
+        box.row().label(text=state.puppet_label, icon='ARMATURE_DATA')
+        box.row().label(text=state.parts_label)
+        box.row().progress(factor=state.progress, type='BAR',
+                           text=state.progress_text)
 
         # --------------------------------------------------------------------
         # CHARACTER VIEW SELECTOR (Primary)
         # --------------------------------------------------------------------
-        self._draw_view_selector(layout, context, props, active_puppet)
+        box = layout.box()
+        box.label(text="Character View", icon='ORIENTATION_VIEW')
+        row = box.row(align=True)
+        for view, label, icon in state.view_buttons:
+            # Setting the enum refreshes visibility via its update callback
+            row.prop_enum(props, "character_view", view, text=label, icon=icon)
 
         # --------------------------------------------------------------------
         # PART SELECTOR (Simplified)
         # --------------------------------------------------------------------
-        self._draw_part_selector(layout, context, props)
-
-        # --------------------------------------------------------------------
-        # CURRENT SELECTION & ACTIONS
-        # --------------------------------------------------------------------
-        self._draw_action_buttons(layout, context, props, active_puppet)
-
-        # --------------------------------------------------------------------
-        # MINI-OUTLINER (Visibility Controls)
-        # --------------------------------------------------------------------
-        self._draw_mini_outliner(layout, context, props, active_puppet)
-
-    def _get_active_puppet(self, context):
-        """Find the active puppet armature."""
-        obj = context.active_object
-        gp_types = ('GPENCIL', 'GREASEPENCIL')
-
-        if obj and obj.type == 'ARMATURE' and obj.get("is_puppet"):
-            return obj
-
-        if obj and obj.type in gp_types and obj.get("puppet_rig"):
-            rig_name = obj.get("puppet_rig")
-            if rig_name and rig_name in bpy.data.objects:
-                return bpy.data.objects[rig_name]
-
-        return None
-
-    def _draw_no_puppet(self, layout, context):
-        """Draw UI when no puppet is selected."""
-        box = layout.box()
-        box.label(text="No puppet selected", icon='INFO')
-
-        # List existing puppets
-        puppets = get_puppets_in_scene()
-        if puppets:
-            box.label(text="Select a puppet:")
-            for puppet in puppets:
-                row = box.row(align=True)
-                row.label(text=puppet["puppet_name"], icon='ARMATURE_DATA')
-                op = row.operator("puppet.select_puppet", text="", icon='RESTRICT_SELECT_OFF')
-                op.puppet_name = puppet.name
-
-        # Create new puppet button
-        layout.separator()
-        layout.operator("puppet.create_puppet", text="Create New Puppet", icon='ADD')
-
-    def _draw_puppet_header(self, layout, puppet):
-        """Draw puppet name and progress."""
-        box = layout.box()
-
-        # Puppet name
-        row = box.row()
-        row.label(text=puppet["puppet_name"], icon='ARMATURE_DATA')
-
-        # Progress indicator
-        drawn, total = count_drawn_parts(puppet)
-        progress = drawn / total if total > 0 else 0
-
-        row = box.row()
-        row.label(text=f"Parts Drawn: {drawn}/{total}")
-
-        # Progress bar
-        row = box.row()
-        row.progress(factor=progress, type='BAR', text=f"{int(progress * 100)}%")
-
-    def _draw_view_selector(self, layout, context, props, puppet):
-        """Draw the character view selector (Front, Quarter, Profile)."""
-        box = layout.box()
-        box.label(text="Character View", icon='ORIENTATION_VIEW')
-
-        # View buttons in a row
-        row = box.row(align=True)
-        for view in CHARACTER_VIEWS:
-            # Check if any parts are drawn for this view
-            view_has_content = self._view_has_content(puppet, view)
-
-            # Nicer labels
-            label = view.replace('_', ' ')
-            if view == 'Quarter_L':
-                label = "3/4 L"
-            elif view == 'Quarter_R':
-                label = "3/4 R"
-            elif view == 'Profile_L':
-                label = "Side L"
-            elif view == 'Profile_R':
-                label = "Side R"
-
-            # Icon shows if view has content
-            is_current = (props.character_view == view)
-            if is_current:
-                icon = 'RADIOBUT_ON'
-            elif view_has_content:
-                icon = 'CHECKBOX_HLT'
-            else:
-                icon = 'CHECKBOX_DEHLT'
-
-            op = row.operator("puppet.set_view", text=label, icon=icon, depress=is_current)
-            op.view = view
-
-    def _draw_part_selector(self, layout, context, props):
-        """Draw simplified part selector."""
         box = layout.box()
         box.label(text="Select Part to Draw", icon='BONE_DATA')
 
@@ -177,28 +261,17 @@ class PUPPET_PT_main_panel(Panel):
         box.prop(props, "part", text="")
 
         # Hand pose selector (only for hands)
-        if props.part.startswith('Hand_'):
+        if state.pose_buttons:
             row = box.row(align=True)
             row.label(text="Pose:")
-            for pose in HAND_POSES:
-                is_current = (props.hand_pose == pose)
-                icon = 'RADIOBUT_ON' if is_current else 'RADIOBUT_OFF'
-                op = row.operator("puppet.set_hand_pose", text=pose, icon=icon, depress=is_current)
-                op.pose = pose
-
-    def _draw_action_buttons(self, layout, context, props, puppet):
-        """Draw current selection status and action buttons."""
-        box = layout.box()
+            for pose, icon in state.pose_buttons:
+                row.prop_enum(props, "hand_pose", pose, icon=icon)
 
-        # Current selection
-        layer_name = get_current_layer_name(context)
-        is_drawn = is_layer_drawn(puppet, layer_name)
-
-        row = box.row()
-        if is_drawn:
-            row.label(text=f"{layer_name}", icon='CHECKMARK')
-        else:
-            row.label(text=f"{layer_name}", icon='LAYER_ACTIVE')
+        # --------------------------------------------------------------------
+        # CURRENT SELECTION & ACTIONS
+        # --------------------------------------------------------------------
+        box = layout.box()
+        box.row().label(text=state.layer_name, icon=state.layer_icon)
 
         # Reference opacity while drawing
         row = box.row(align=True)
@@ -216,71 +289,116 @@ class PUPPET_PT_main_panel(Panel):
         # Draw button
         row = layout.row()
         row.scale_y = 2.0
-        op_text = "DRAW" if not is_drawn else "EDIT"
-        row.operator("puppet.draw_part", text=op_text, icon='GREASEPENCIL')
+        row.operator("puppet.draw_part", text=state.draw_text, icon='GREASEPENCIL')
 
-    def _draw_mini_outliner(self, layout, context, props, puppet):
-        """Draw mini-outliner with visibility toggles for each part."""
+    def _draw_no_puppet(self, layout, context):
+        """Draw UI when no puppet is selected."""
         box = layout.box()
+        box.label(text="No puppet selected", icon='INFO')
 
-        # Collapsible header
-        row = box.row()
-        row.label(text="Parts (Outliner)", icon='OUTLINER')
+        # List existing puppets
+        puppets = _get_puppets_cached(context)
+        if puppets:
+            box.label(text="Select a puppet:")
+            for puppet in puppets:
+                row = box.row(align=True)
+                row.label(text=puppet["puppet_name"], icon='ARMATURE_DATA')
+                op = row.operator("puppet.select_puppet", text="", icon='RESTRICT_SELECT_OFF')
+                op.puppet_name = puppet.name
 
-        if not puppet:
-            return
+        # Create new puppet button
+        layout.separator()
+        layout.operator("puppet.create_puppet", text="Create New Puppet", icon='ADD')
 
-        current_view = props.character_view
-        puppet_name = puppet.get("puppet_name", "")
 
-        # List each part with visibility toggle and drawn status
+# ----------------------------------------------------------------------------
+# MINI-OUTLINER SUB-PANEL
+# ----------------------------------------------------------------------------
+
+class PUPPET_PT_outliner_panel(Panel):
+    """Mini-outliner with visibility toggles; only drawn when expanded"""
+
+    bl_label = "Parts (Outliner)"
+    bl_idname = "PUPPET_PT_outliner_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Puppet Mode"
+    bl_parent_id = "PUPPET_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return get_active_puppet(context) is not None
+
+    def draw_header(self, context):
+        self.layout.label(icon='OUTLINER')
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        puppet = get_active_puppet(context)
+        if puppet is None:
+            return
+
+        # Rows come straight from OUTLINER_PARTS; this sub-panel is only
+        # drawn while expanded, so collapsed redraws skip them entirely
+        props = scene.puppet_selector
+        names = _outliner_names(puppet.get("puppet_name", ""),
+                                props.character_view, props.hand_pose)
+        objects = bpy.data.objects
         for part_id, part_label in OUTLINER_PARTS:
-            row = box.row(align=True)
+            _draw_outliner_row(layout.row(align=True), props,
+                               part_id, part_label, names, objects)
+
+
+# ----------------------------------------------------------------------------
+# MINI-OUTLINER ROWS
+# ----------------------------------------------------------------------------
 
-            # Determine the layer name for this part
-            if part_id in VIEW_DEPENDENT_PARTS:
-                layer_name = f"{part_id}_{current_view}"
-            elif part_id.startswith('Hand_'):
-                layer_name = f"{part_id}_{props.hand_pose}"
-            else:
-                layer_name = part_id
-
-            # Check if drawn (GP object exists)
-            drawn = is_layer_drawn(puppet, layer_name)
-
-            # Visibility toggle (only if GP object exists)
-            if drawn:
-                gp_name = get_gp_object_name(puppet_name, layer_name)
-                gp_obj = bpy.data.objects.get(gp_name)
-                if gp_obj:
-                    icon_vis = 'HIDE_OFF' if not gp_obj.hide_viewport else 'HIDE_ON'
-                    op = row.operator("puppet.toggle_layer_visibility", text="", icon=icon_vis)
-                    op.layer_name = layer_name
-                else:
-                    row.label(text="", icon='BLANK1')
-            else:
-                row.label(text="", icon='BLANK1')
-
-            # Part label with drawn indicator
-            icon = 'CHECKMARK' if drawn else 'DOT'
-            row.label(text=part_label, icon=icon)
-
-            # Select button
-            is_selected = (props.part == part_id)
-            icon_sel = 'LAYER_ACTIVE' if is_selected else 'LAYER_USED'
-            op = row.operator("puppet.quick_select_part", text="", icon=icon_sel)
-            op.part = part_id
-
-    def _view_has_content(self, puppet, view):
-        """Check if any parts have been drawn for a given view."""
-        if not puppet:
-            return False
-
-        for part in VIEW_DEPENDENT_PARTS:
-            layer_name = f"{part}_{view}"
-            if is_layer_drawn(puppet, layer_name):
-                return True
-        return False
+@lru_cache(maxsize=32)
+def _outliner_names(puppet_name, view, hand_pose):
+    """
+    Map each outliner part to its (layer_name, gp_object_name).
+    Only changes with the puppet, view or hand pose, so it's built once
+    per combination instead of formatted per row on every redraw.
+    """
+    names = {}
+    for part_id, _label in OUTLINER_PARTS:
+        layer_name = LAYER_NAME.get((part_id, view, hand_pose), part_id)
+        names[part_id] = (layer_name, get_gp_object_name(puppet_name, layer_name))
+    return names
+
+
+def _draw_outliner_row(row, props, part_id, part_label, names, objects):
+    """
+    Draw one outliner row: visibility toggle, drawn status, select button.
+    names comes from _outliner_names(); objects is the scene's objects.
+    """
+    layer_name, gp_name = names[part_id]
+
+    # Drawn means the GP object exists
+    gp_obj = objects.get(gp_name)
+    drawn = gp_obj is not None
+
+    row_operator = row.operator
+    row_label = row.label
+
+    # Visibility toggle (only if GP object exists)
+    if drawn:
+        op = row_operator("puppet.toggle_layer_visibility", text="",
+                          icon=HIDDEN_ICON[gp_obj.hide_viewport])
+        op.layer_name = layer_name
+    else:
+        row_label(text="", icon='BLANK1')
+
+    # Part label with drawn indicator
+    row_label(text=part_label, icon=DRAWN_ICON[drawn])
+
+    # Select button
+    op = row_operator("puppet.quick_select_part", text="",
+                      icon=SELECTED_ICON[props.part == part_id])
+    op.part = part_id
 
 
 # ----------------------------------------------------------------------------
@@ -297,12 +415,9 @@ class PUPPET_OT_select_puppet(Operator):
     puppet_name: bpy.props.StringProperty(name="Puppet Name")
 
     def execute(self, context):
-        if self.puppet_name in bpy.data.objects:
-            puppet = bpy.data.objects[self.puppet_name]
-            for obj in bpy.data.objects:
-                obj.select_set(False)
-            puppet.select_set(True)
-            context.view_layer.objects.active = puppet
+        puppet = get_scene_object(context, self.puppet_name)
+        if puppet is not None:
+            select_only(context, puppet)
             self.report({'INFO'}, f"Selected {self.puppet_name}")
         return {'FINISHED'}
 
@@ -318,9 +433,11 @@ class PUPPET_OT_set_view(Operator):
 
     def execute(self, context):
         props = context.scene.puppet_selector
-        props.character_view = self.view
-        # Refresh the view to show parts for this angle
-        bpy.ops.puppet.view_part()
+        if props.character_view != self.view:
+            # The property's update callback schedules the refresh
+            props.character_view = self.view
+        else:
+            schedule_view_visibility()
         return {'FINISHED'}
 
 
@@ -349,18 +466,7 @@ class PUPPET_OT_toggle_layer_visibility(Operator):
     layer_name: bpy.props.StringProperty(name="Layer Name")
 
     def execute(self, context):
-        # Find puppet armature
-        obj = context.active_object
-        armature = None
-        gp_types = ('GPENCIL', 'GREASEPENCIL')
-
-        if obj and obj.type == 'ARMATURE' and obj.get("is_puppet"):
-            armature = obj
-        elif obj and obj.type in gp_types and obj.get("puppet_rig"):
-            rig_name = obj["puppet_rig"]
-            if rig_name in bpy.data.objects:
-                armature = bpy.data.objects[rig_name]
-
+        armature = get_active_puppet(context)
         if not armature:
             self.report({'WARNING'}, "No puppet found")
             return {'CANCELLED'}
@@ -371,6 +477,7 @@ class PUPPET_OT_toggle_layer_visibility(Operator):
 
         if gp_obj:
             gp_obj.hide_viewport = not gp_obj.hide_viewport
+            clear_draw_state(context)
             status = "hidden" if gp_obj.hide_viewport else "visible"
             self.report({'INFO'}, f"{self.layer_name}: {status}")
         else:
@@ -392,12 +499,7 @@ class PUPPET_OT_quick_select_part(Operator):
         props = context.scene.puppet_selector
 
         # Set the region based on part
-        if self.part in ['Head', 'Face_Features', 'Mouth']:
-            props.region = 'FACE'
-        elif self.part.startswith('Hand_'):
-            props.region = 'HANDS'
-        else:
-            props.region = 'BODY'
+        props.region = PART_TO_REGION.get(self.part, 'BODY')
 
         # Set the part (needs to happen after region for enum to be valid)
         props.part = self.part
@@ -411,6 +513,7 @@ class PUPPET_OT_quick_select_part(Operator):
 
 classes = [
     PUPPET_PT_main_panel,
+    PUPPET_PT_outliner_panel,
     PUPPET_OT_select_puppet,
     PUPPET_OT_set_view,
     PUPPET_OT_set_hand_pose,
@@ -418,12 +521,4 @@ classes = [
     PUPPET_OT_quick_select_part,
 ]
 
-
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)